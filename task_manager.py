@@ -1,12 +1,54 @@
+import atexit
+import bisect
 import datetime
+import functools
+import heapq
 import json
 import os
+import sys
+import threading
 from collections import deque
 
+try:
+    import orjson
+except ImportError:   # optional speedup, fall back to the stdlib
+    orjson = None
+
+
+def _dumps(obj):
+    """Serialize obj to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data):
+    """Parse JSON from bytes. Raises ValueError on bad input.
+
+    orjson raises json.JSONDecodeError; the stdlib path can also raise
+    UnicodeDecodeError on a truncated UTF-8 sequence.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+_PRIORITY_ORDER = {"High": 1, "Medium": 2, "Low": 3}   # unknown priorities rank 4
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_date(s):
+    """Parse a YYYY-MM-DD string; cached since many tasks share a due date."""
+    return datetime.date.fromisoformat(s)
+
+
 # ------------------------------
 # Task Class
 # ------------------------------
 class Task:
+    __slots__ = ("id", "title", "description", "priority", "due_date", "status",
+                 "_due_date_str", "_title_lc", "_desc_lc", "_prio_rank", "_str_cache")
+
     task_counter = 1
 
     def __init__(self, title, description, priority, due_date, status="Pending", task_id=None):
@@ -18,12 +60,18 @@ class Task:
 
         self.title = title
         self.description = description
-        self.priority = priority
+        self._title_lc = title.lower()         # lowercase copies for search_tasks
+        self._desc_lc = description.lower()
+        self.priority = sys.intern(priority)   # few distinct values, share one object each
+        self._prio_rank = _PRIORITY_ORDER.get(self.priority, 4)
         self.due_date = due_date
-        self.status = status
+        self._due_date_str = due_date.isoformat()   # due_date never changes, format it once
+        self.status = sys.intern(status)
+        self._str_cache = None   # built on first __str__, reset when status changes
 
     def mark_complete(self):
         self.status = "Completed"
+        self._str_cache = None
 
     def to_dict(self):
         return {
@@ -31,13 +79,13 @@ class Task:
             "title": self.title,
             "description": self.description,
             "priority": self.priority,
-            "due_date": self.due_date.strftime("%Y-%m-%d"),
+            "due_date": self._due_date_str,
             "status": self.status,
         }
 
     @staticmethod
     def from_dict(data):
-        due_date_obj = datetime.datetime.strptime(data["due_date"], "%Y-%m-%d").date()
+        due_date_obj = _parse_date(data["due_date"])
         return Task(
             data["title"],
             data["description"],
@@ -48,7 +96,9 @@ class Task:
         )
 
     def __str__(self):
-        return f"[{self.id}] {self.title} ({self.priority}) - Due: {self.due_date} - {self.status}"
+        if self._str_cache is None:
+            self._str_cache = f"[{self.id}] {self.title} ({self.priority}) - Due: {self._due_date_str} - {self.status}"
+        return self._str_cache
 
 
 # ------------------------------
@@ -56,76 +106,121 @@ class Task:
 # ------------------------------
 class TaskManager:
     FILE_NAME = "tasks.json"
+    LOG_NAME = "tasks.log"   # append-only journal of changes since the last snapshot
+    COMPACT_EVERY = 100      # fold the journal into FILE_NAME after this many changes
+    FLUSH_DELAY = 0.5        # seconds to coalesce journal writes before flushing
+    UNDO_LIMIT = 50          # only the most recent deletions can be undone
 
     def __init__(self):
-        self.tasks = []
-        self.undo_stack = []   # stack for undo
-        self.reminder_queue = deque()  # queue for reminders
+        self._by_id = {}   # task_id -> Task in insertion order; the task store
+        self._by_due = []  # sorted (due_date, task_id) keys
+        self._by_prio = []  # sorted (priority rank, due_date, task_id) keys
+        self._view = None   # sorted index giving the current order, None for insertion order
+        self.undo_stack = deque(maxlen=self.UNDO_LIMIT)   # stack for undo, oldest entries drop off
+        self.reminder_heap = []  # min-heap of (due_date, task_id, task) for reminders
+        self._ops_since_compact = 0
+        self._dirty = False   # in-memory tasks differ from FILE_NAME
+        self._pending = []    # encoded journal lines not yet written
+        self._flush_timer = None
+        self._io_lock = threading.Lock()   # guards _pending, _flush_timer and the journal file
         self.load_tasks()
+        self._log = open(self.LOG_NAME, "ab", buffering=0)
+        if self._ops_since_compact:
+            # Fold a leftover journal in now so new events never land after a torn line
+            self.compact()
         self.build_reminder_queue()
 
+    # ---------- Indexes ----------
+    @property
+    def tasks(self):
+        """All tasks, in the order chosen by the last sort."""
+        return list(self._iter_tasks())
+
+    def _iter_tasks(self):
+        if self._view is None:
+            return iter(self._by_id.values())
+        return (self._by_id[key[-1]] for key in self._view)
+
+    @staticmethod
+    def _due_key(task):
+        return (task.due_date, task.id)
+
+    @staticmethod
+    def _priority_key(task):
+        return (task._prio_rank, task.due_date, task.id)
+
+    def _insert_task(self, task):
+        """Add task to the id lookup and both sorted indexes."""
+        self._by_id[task.id] = task
+        bisect.insort(self._by_due, self._due_key(task))
+        bisect.insort(self._by_prio, self._priority_key(task))
+
+    def _remove_task(self, task):
+        """Undo _insert_task."""
+        del self._by_id[task.id]
+        for index, key in ((self._by_due, self._due_key(task)), (self._by_prio, self._priority_key(task))):
+            del index[bisect.bisect_left(index, key)]
+
     # ---------- CRUD ----------
     def add_task(self, title, description, priority, due_date):
         try:
-            due_date_obj = datetime.datetime.strptime(due_date, "%Y-%m-%d").date()
+            due_date_obj = datetime.date.fromisoformat(due_date)
             task = Task(title, description, priority, due_date_obj)
-            self.tasks.append(task)
-            self.save_tasks()
+            self._insert_task(task)
+            self._record({"op": "add", "task": task.to_dict()})
 
-            # Add to reminder queue if due soon
+            # Add to reminder heap if due soon
             if (due_date_obj - datetime.date.today()).days <= 3:
-                self.reminder_queue.append(task)
+                heapq.heappush(self.reminder_heap, (due_date_obj, task.id, task))
 
             print("✅ Task added successfully!\n")
         except ValueError:
             print("⚠ Invalid date format! Use YYYY-MM-DD.\n")
 
     def view_tasks(self):
-        if not self.tasks:
+        if not self._by_id:
             print("⚠ No tasks available.\n")
             return
-        for task in self.tasks:
-            print(task)
-        print()
+        sys.stdout.write("\n".join(map(str, self._iter_tasks())) + "\n\n")
 
     def mark_task_complete(self, task_id):
-        for task in self.tasks:
-            if task.id == task_id:
-                task.mark_complete()
-                self.save_tasks()
-                print("✅ Task marked as completed!\n")
-                return
-        print("⚠ Task not found!\n")
+        task = self._by_id.get(task_id)
+        if task is None:
+            print("⚠ Task not found!\n")
+            return
+        if task.status != "Completed":
+            task.mark_complete()
+            self._record({"op": "complete", "id": task_id})
+        print("✅ Task marked as completed!\n")
 
     def delete_task(self, task_id):
-        for task in self.tasks:
-            if task.id == task_id:
-                self.undo_stack.append(task)  # save for undo
-                self.tasks.remove(task)
-                self.save_tasks()
-                print("🗑 Task deleted successfully! (Undo available)\n")
-                return
-        print("⚠ Task not found!\n")
+        task = self._by_id.get(task_id)
+        if task is None:
+            print("⚠ Task not found!\n")
+            return
+        self.undo_stack.append(task)  # save for undo
+        self._remove_task(task)
+        self._record({"op": "delete", "id": task_id})
+        print("🗑 Task deleted successfully! (Undo available)\n")
 
     # ---------- Sorting ----------
     def sort_by_due_date(self):
-        self.tasks.sort(key=lambda t: t.due_date)
+        self._view = self._by_due
         print("📅 Tasks sorted by due date!\n")
         self.view_tasks()
 
     def sort_by_priority(self):
-        priority_order = {"High": 1, "Medium": 2, "Low": 3}
-        self.tasks.sort(key=lambda t: priority_order.get(t.priority, 4))
+        self._view = self._by_prio
         print("⭐ Tasks sorted by priority!\n")
         self.view_tasks()
 
     # ---------- Searching ----------
     def search_tasks(self, keyword):
-        results = [task for task in self.tasks if keyword.lower() in task.title.lower() or keyword.lower() in task.description.lower()]
+        kw = keyword.lower()
+        results = [task for task in self.tasks if kw in task._title_lc or kw in task._desc_lc]
         if results:
-            print(f"🔍 Search results for '{keyword}':\n")
-            for task in results:
-                print(task)
+            lines = "\n".join(map(str, results))
+            sys.stdout.write(f"🔍 Search results for '{keyword}':\n\n{lines}\n")
         else:
             print(f"⚠ No tasks found with keyword '{keyword}'.\n")
 
@@ -135,40 +230,144 @@ class TaskManager:
             print("⚠ Nothing to undo.\n")
             return
         last_deleted = self.undo_stack.pop()
-        self.tasks.append(last_deleted)
-        self.save_tasks()
+        self._insert_task(last_deleted)
+        self._record({"op": "add", "task": last_deleted.to_dict()})
         print(f"↩ Undo successful! Restored task: {last_deleted}\n")
 
-    # ---------- Reminders (Queue) ----------
+    # ---------- Reminders (Heap) ----------
     def build_reminder_queue(self):
-        """Rebuild the reminder queue from tasks due soon."""
-        self.reminder_queue.clear()
-        for task in sorted(self.tasks, key=lambda t: t.due_date):
-            if (task.due_date - datetime.date.today()).days <= 3 and task.status == "Pending":
-                self.reminder_queue.append(task)
+        """Rebuild the reminder heap from tasks due soon."""
+        today = datetime.date.today()
+        self.reminder_heap = [
+            (task.due_date, task.id, task) for task in self._by_id.values()
+            if (task.due_date - today).days <= 3 and task.status == "Pending"
+        ]
+        heapq.heapify(self.reminder_heap)
 
     def show_next_reminder(self):
-        if not self.reminder_queue:
+        if not self.reminder_heap:
             print("📭 No upcoming reminders!\n")
             return
-        next_task = self.reminder_queue.popleft()
+        _, _, next_task = heapq.heappop(self.reminder_heap)
         print(f"🔔 Reminder: {next_task}\n")
 
     # ---------- File I/O ----------
+    def _record(self, event):
+        """Queue a single change for the journal instead of rewriting the snapshot."""
+        with self._io_lock:
+            self._pending.append(_dumps(event) + b"\n")
+        self._dirty = True
+        self._ops_since_compact += 1
+        if self._ops_since_compact >= self.COMPACT_EVERY:
+            self.compact()
+        else:
+            self._schedule_save()
+
+    def _schedule_save(self):
+        """Flush queued journal lines after FLUSH_DELAY, coalescing bursts of changes."""
+        with self._io_lock:
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.FLUSH_DELAY, self._flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _flush(self):
+        with self._io_lock:
+            self._flush_timer = None
+            if self._pending:
+                self._log.write(b"".join(self._pending))
+                self._pending.clear()
+
+    def compact(self):
+        """Write a full snapshot to FILE_NAME and empty the journal."""
+        with self._io_lock:
+            # Queued lines are already reflected in memory, so the snapshot covers them
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._pending.clear()
+            self.save_tasks()
+            self._log.truncate(0)
+        self._ops_since_compact = 0
+
+    def close(self):
+        """Flush and compact the journal, then release it. Safe to call twice."""
+        if self._log.closed:
+            return
+        self._flush()
+        self.compact()
+        atexit.unregister(self.close)
+        self._log.close()
+
     def save_tasks(self):
-        with open(self.FILE_NAME, "w") as f:
-            json.dump([task.to_dict() for task in self.tasks], f, indent=4)
+        if not self._dirty:
+            return
+        # Stream one task at a time rather than building the whole array first.
+        # Write to a temp file and swap it in so a crash never leaves a torn snapshot.
+        tmp_name = self.FILE_NAME + ".tmp"
+        with open(tmp_name, "wb") as f:
+            f.write(b"[")
+            for i, task in enumerate(self._iter_tasks()):
+                if i:
+                    f.write(b",")
+                f.write(_dumps(task.to_dict()))
+            f.write(b"]")
+        os.replace(tmp_name, self.FILE_NAME)
+        self._dirty = False
 
     def load_tasks(self):
         if os.path.exists(self.FILE_NAME):
-            with open(self.FILE_NAME, "r") as f:
+            with open(self.FILE_NAME, "rb") as f:
+                try:
+                    tasks_data = _loads(f.read())
+                except ValueError:
+                    tasks_data = []
+            # Build the store and index keys and track the highest id in one pass
+            max_id = 0
+            for data in tasks_data:
+                task = Task.from_dict(data)
+                self._by_id[task.id] = task
+                self._by_due.append(self._due_key(task))
+                self._by_prio.append(self._priority_key(task))
+                if task.id > max_id:
+                    max_id = task.id
+            self._by_due.sort()
+            self._by_prio.sort()
+            if max_id:
+                Task.task_counter = max_id + 1
+        self.replay_log()
+
+    def replay_log(self):
+        """Apply journaled changes on top of the snapshot loaded from FILE_NAME."""
+        if not os.path.exists(self.LOG_NAME):
+            return
+        with open(self.LOG_NAME, "rb") as f:
+            for line in f:
+                self._ops_since_compact += 1
                 try:
-                    tasks_data = json.load(f)
-                    self.tasks = [Task.from_dict(data) for data in tasks_data]
-                    if self.tasks:
-                        Task.task_counter = max(task.id for task in self.tasks) + 1
-                except json.JSONDecodeError:
-                    self.tasks = []
+                    event = _loads(line)
+                except ValueError:   # JSONDecodeError, or UnicodeDecodeError on a torn multi-byte char
+                    break   # torn final write, nothing valid after it
+                self._apply_event(event)
+                self._dirty = True
+
+    def _apply_event(self, event):
+        # Replay must be idempotent: a crash between writing the snapshot and
+        # truncating the journal leaves events that are already in FILE_NAME.
+        op = event["op"]
+        if op == "add":
+            task = Task.from_dict(event["task"])
+            if task.id not in self._by_id:
+                self._insert_task(task)
+                Task.task_counter = max(Task.task_counter, task.id + 1)
+        elif op == "complete":
+            task = self._by_id.get(event["id"])
+            if task:
+                task.mark_complete()
+        elif op == "delete":
+            task = self._by_id.get(event["id"])
+            if task:
+                self._remove_task(task)
 
 
 # ------------------------------
@@ -176,6 +375,7 @@ class TaskManager:
 # ------------------------------
 def main():
     manager = TaskManager()
+    atexit.register(manager.close)   # also covers leaving via Ctrl+C / EOF
 
     while True:
         print("===== SMART TASK MANAGER =====")
@@ -233,6 +433,7 @@ def main():
 
         elif choice == "10":
             print("👋 Exiting Task Manager. Goodbye!")
+            manager.close()
             break
         else:
             print("⚠ Invalid choice. Try again!\n")